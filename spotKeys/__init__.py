@@ -1,6 +1,10 @@
+import os
 import pathlib
 
 __version__ = '0.3.0'
 
 PROJECT_PACKAGE = pathlib.Path(__file__).resolve().parent
 BASE_DIR = PROJECT_PACKAGE.parent
+
+# Per-user writable directory for app data like caches
+APP_DATA_DIR = pathlib.Path(os.environ.get('APPDATA', pathlib.Path.home())) / 'SpotKeys'
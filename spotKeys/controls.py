@@ -1,13 +1,16 @@
 """Defines user-facing controls to use Spotify."""
 
 import logging
+import threading
+import time
 from functools import wraps
 
 import pyperclip
 from spotipy.exceptions import SpotifyException
 
-from spotKeys import speech, updater
+from spotKeys import dialogs, dispatch, library, speech, updater
 from spotKeys.spotify import SPOTIFY_HANDLER as spotifyHandler
+from spotKeys.state import AppStateStore
 
 # Spotify URL partitions
 SPOTIFY_URL = 'https://open.spotify.com'
@@ -16,8 +19,20 @@ TRACK_URL = f'{SPOTIFY_URL}/track'
 # Store default values
 VOLUME_PERCENTAGE_INTERVAL = 10
 
+# Overall deadline for gathering the status announcement, in seconds
+STATUS_DEADLINE_SECONDS = 1.5
+
+# Default latency budgets, in seconds
+# Info controls answer from the last known playback context after this long
+INFO_DEADLINE_SECONDS = 0.75
+# Write controls speak a cue after this long, then confirm or report failure when done
+WRITE_DEADLINE_SECONDS = 0.5
+
 # Store any app-level state
-APP_STATE = {}
+APP_STATE = AppStateStore()
+
+# Per-thread write control state: how deeply write controls are nested, and the outermost one's Working cue
+_writeControl = threading.local()
 
 # Repeat cycle mapping (off -> track -> context -> off)
 REPEAT_STATES = {
@@ -45,28 +60,162 @@ def getCurrentPlaybackContext() -> dict:
 	Gets the context payload for the currently-playing media.
 	If media is playing, the payload is returned.
 	Otherwise, a NoMediaPlaying error is raised.
+	The payload is also kept in APP_STATE as the last known playback context.
 	"""
 
 	if not (currentPlaybackContext := spotifyHandler.current_playback()):
 		raise NoMediaPlayingError()
+	APP_STATE.set(lastPlaybackContext=currentPlaybackContext)
 	return currentPlaybackContext
 
 
+def dropCaches() -> None:
+	"""Drops cached Spotify data that can be fetched again, like the last known playback context."""
+
+	APP_STATE.set(lastPlaybackContext=None)
+
+
+def rewarm() -> None:
+	"""Fetches the playback context to reopen connections, refresh the token and repopulate caches."""
+
+	try:
+		getCurrentPlaybackContext()
+	except NoMediaPlayingError:
+		pass
+
+
 def checkForPlayingMedia(function):
-	"""Decorator to check if media is playing before executing the function."""
+	"""
+	Decorator to check if media is playing before executing the function.
+	If nothing is playing, that is announced and NoMediaPlayingError re-raised so callers (like IPC) see it.
+	"""
 
 	@wraps(function)
 	def wrapper(*args, **kwargs):
 		try:
 			currentPlaybackContext = getCurrentPlaybackContext()
-			return function(currentPlaybackContext, *args, **kwargs)
 		except NoMediaPlayingError:
-			speech.say('No media playing', interrupt=True)
-			return
+			announce('No media playing', interrupt=True)
+			raise
+		return function(currentPlaybackContext, *args, **kwargs)
 
 	return wrapper
 
 
+def checkForPlayingMediaWithin(deadline: float = INFO_DEADLINE_SECONDS):
+	"""
+	Decorator like checkForPlayingMedia that bounds the wait for the playback context to the deadline in seconds.
+	If the live fetch misses the deadline or fails, the function gets the last known playback context instead.
+	The function is called with `isStale` set to whether the context came from that fallback.
+	Errors are announced and re-raised, like in checkForPlayingMedia.
+	"""
+
+	def decorator(function):
+		@wraps(function)
+		def wrapper(*args, **kwargs):
+			try:
+				currentPlaybackContext = dispatch.fanOut(getCurrentPlaybackContext).result(timeout=deadline)
+				isStale = False
+			except NoMediaPlayingError:
+				announce('No media playing', interrupt=True)
+				raise
+			except Exception:
+				if not (currentPlaybackContext := APP_STATE.get('lastPlaybackContext')):
+					announce('Spotify is not responding', interrupt=True)
+					raise
+				isStale = True
+
+			return function(currentPlaybackContext, *args, isStale=isStale, **kwargs)
+
+		return wrapper
+
+	return decorator
+
+
+class WorkingCue:
+	"""
+	Speaks "Working" once a write control has run for longer than its deadline.
+	Cancelling takes the same lock as speaking, so once `cancel()` returns the cue can't speak anymore.
+	"""
+
+	def __init__(self, deadline: float):
+		"""Start the timer for the cue."""
+
+		self._lock = threading.Lock()
+		self._isCancelled = False
+		self._timer = threading.Timer(deadline, self._speak)
+		self._timer.daemon = True
+		self._timer.start()
+
+	def _speak(self):
+		"""Speak the cue unless it was cancelled."""
+
+		with self._lock:
+			if not self._isCancelled:
+				speech.say('Working', interrupt=True)
+
+	def cancel(self):
+		"""Stop the cue from being spoken."""
+
+		with self._lock:
+			self._isCancelled = True
+		self._timer.cancel()
+
+
+def announce(text: str, interrupt: bool = False) -> None:
+	"""
+	Speaks text on behalf of a control.
+	Inside a write control, its Working cue is cancelled first, so the cue can't cut this announcement off.
+	"""
+
+	if cue := getattr(_writeControl, 'cue', None):
+		cue.cancel()
+	speech.say(text, interrupt=interrupt)
+
+
+def confirmWithin(failureMessage: str, deadline: float = WRITE_DEADLINE_SECONDS):
+	"""
+	Decorator for controls that change playback.
+	If the control hasn't finished within the deadline in seconds, a "Working" cue is spoken.
+	The control confirms success itself through `announce()`; if it raises, the failure message is spoken
+	and the error re-raised. NoMediaPlayingError was already announced, so it is re-raised without one.
+	Nested write controls (like volume controls unmuting) only cue once.
+	"""
+
+	def decorator(function):
+		@wraps(function)
+		def wrapper(*args, **kwargs):
+			depth = getattr(_writeControl, 'depth', 0)
+			_writeControl.depth = depth + 1
+
+			if depth == 0:
+				_writeControl.cue = WorkingCue(deadline)
+
+			try:
+				return function(*args, **kwargs)
+			except NoMediaPlayingError:
+				raise
+			except Exception:
+				if depth == 0:
+					announce(failureMessage, interrupt=True)
+				raise
+			finally:
+				if depth == 0:
+					_writeControl.cue.cancel()
+					_writeControl.cue = None
+				_writeControl.depth = depth
+
+		return wrapper
+
+	return decorator
+
+
+def markIfStale(text: str, isStale: bool) -> str:
+	"""Marks announcement text as possibly outdated when it came from the last known playback context."""
+
+	return f'{text}, possibly outdated' if isStale else text
+
+
 # The following functions do not check if media is playing
 # They simply return data from a given playback context payload
 # They also can be used to compose larger forms of text like long trac descriptions
@@ -96,6 +245,21 @@ def getTrackID(currentPlaybackContext) -> str:
 	return currentPlaybackContext['item']['id']
 
 
+def formatDuration(milliseconds: int) -> str:
+	"""Formats a duration in milliseconds as minutes and seconds, like 3:07."""
+
+	minutes, seconds = divmod(milliseconds // 1000, 60)
+	return f'{minutes}:{seconds:02}'
+
+
+def isTrackLiked(trackID: str) -> bool:
+	"""Returns whether the track with the given ID is in the user's Liked Songs."""
+
+	return spotifyHandler.current_user_saved_tracks_contains([trackID])[0]
+
+
+@dispatch.lane(dispatch.TRANSPORT_LANE)
+@confirmWithin('Could not play or pause')
 @checkForPlayingMedia
 def playOrPause(currentPlaybackContext) -> None:
 	"""
@@ -109,28 +273,34 @@ def playOrPause(currentPlaybackContext) -> None:
 
 	if isPlaying:
 		spotifyHandler.pause_playback()
-		speech.say('Paused', interrupt=True)
+		announce('Paused', interrupt=True)
 	else:
 		spotifyHandler.start_playback()
-		speech.say('Playing', interrupt=True)
+		announce('Playing', interrupt=True)
 
 
+@dispatch.lane(dispatch.TRANSPORT_LANE)
+@confirmWithin('Could not skip to the previous track')
 @checkForPlayingMedia
 def previousTrack(currentPlaybackContext) -> None:
 	"""Moves to the previous track."""
 
 	spotifyHandler.previous_track()
-	speech.say('Previous track', interrupt=True)
+	announce('Previous track', interrupt=True)
 
 
+@dispatch.lane(dispatch.TRANSPORT_LANE)
+@confirmWithin('Could not skip to the next track')
 @checkForPlayingMedia
 def nextTrack(currentPlaybackContext) -> None:
 	"""Moves to the next track."""
 
 	spotifyHandler.next_track()
-	speech.say('Next track', interrupt=True)
+	announce('Next track', interrupt=True)
 
 
+@dispatch.lane(dispatch.SEEK_LANE)
+@confirmWithin('Could not rewind')
 @checkForPlayingMedia
 def rewind(currentPlaybackContext, milliseconds=3000) -> None:
 	"""
@@ -146,6 +316,8 @@ def rewind(currentPlaybackContext, milliseconds=3000) -> None:
 	spotifyHandler.seek_track(newPosition)
 
 
+@dispatch.lane(dispatch.SEEK_LANE)
+@confirmWithin('Could not fast-forward')
 @checkForPlayingMedia
 def fastForward(currentPlaybackContext, milliseconds=3000) -> None:
 	"""
@@ -185,9 +357,13 @@ def fastForward(currentPlaybackContext, milliseconds=3000) -> None:
 # - Implement additional checks and balances within the app to handle discrepancies in volume data reported by the API.
 #
 # Implemented Solution:
-#
+# - Volume and mute controls run one at a time in the volume lane (see `dispatch`),
+# so each read-modify-write of the volume finishes before the next one starts.
+# - The pre-mute volume lives in the thread-safe APP_STATE store.
 
 
+@dispatch.lane(dispatch.VOLUME_LANE)
+@confirmWithin('Could not change the volume')
 @checkForPlayingMedia
 def decreaseVolume(currentPlaybackContext, percentage=VOLUME_PERCENTAGE_INTERVAL) -> None:
 	"""
@@ -208,9 +384,11 @@ def decreaseVolume(currentPlaybackContext, percentage=VOLUME_PERCENTAGE_INTERVAL
 		newVolume = round(newVolume / percentage) * percentage
 
 		spotifyHandler.volume(newVolume)
-		speech.say(f'{newVolume}% volume', interrupt=True)
+		announce(f'{newVolume}% volume', interrupt=True)
 
 
+@dispatch.lane(dispatch.VOLUME_LANE)
+@confirmWithin('Could not change the volume')
 @checkForPlayingMedia
 def increaseVolume(currentPlaybackContext, percentage=VOLUME_PERCENTAGE_INTERVAL) -> None:
 	"""
@@ -231,9 +409,11 @@ def increaseVolume(currentPlaybackContext, percentage=VOLUME_PERCENTAGE_INTERVAL
 		newVolume = round(newVolume / percentage) * percentage
 
 		spotifyHandler.volume(newVolume)
-		speech.say(f'{newVolume}% volume', interrupt=True)
+		announce(f'{newVolume}% volume', interrupt=True)
 
 
+@dispatch.lane(dispatch.LIBRARY_LANE)
+@confirmWithin('Could not add to Liked Songs')
 @checkForPlayingMedia
 def likeCurrentTrack(currentPlaybackContext) -> None:
 	"""Adds the currently-playing track to the user's Liked Songs."""
@@ -241,13 +421,15 @@ def likeCurrentTrack(currentPlaybackContext) -> None:
 	trackID = track['id']
 	trackName = track['name']
 
-	if spotifyHandler.current_user_saved_tracks_contains([trackID])[0]:
-		speech.say(f'{trackName} is already in your Liked Songs', interrupt=True)
+	if isTrackLiked(trackID):
+		announce(f'{trackName} is already in your Liked Songs', interrupt=True)
 	else:
 		spotifyHandler.current_user_saved_tracks_add([trackID])
-		speech.say(f'Added {trackName} to Liked Songs', interrupt=True)
+		announce(f'Added {trackName} to Liked Songs', interrupt=True)
 
 
+@dispatch.lane(dispatch.LIBRARY_LANE)
+@confirmWithin('Could not remove from Liked Songs')
 @checkForPlayingMedia
 def dislikeCurrentTrack(currentPlaybackContext) -> None:
 	"""Removes the currently-playing track from the user's Liked Songs."""
@@ -255,60 +437,76 @@ def dislikeCurrentTrack(currentPlaybackContext) -> None:
 	trackID = track['id']
 	trackName = track['name']
 
-	if not spotifyHandler.current_user_saved_tracks_contains([trackID])[0]:
-		speech.say(f'{trackName} is not in your Liked Songs', interrupt=True)
+	if not isTrackLiked(trackID):
+		announce(f'{trackName} is not in your Liked Songs', interrupt=True)
 	else:
 		spotifyHandler.current_user_saved_tracks_delete([trackID])
-		speech.say(f'Removed {trackName} from Liked Songs', interrupt=True)
+		announce(f'Removed {trackName} from Liked Songs', interrupt=True)
 
 
+@dispatch.lane(dispatch.VOLUME_LANE)
+@confirmWithin('Could not mute or unmute')
 @checkForPlayingMedia
 def muteOrUnmute(currentPlaybackContext) -> None:
 	"""
 	Mutes or unmutes the current track dynamically.
 	If the current volume is greater than 0,
-	it stores the current volume in the app's state dictionary,
+	it stores the current volume in the app's state store,
 	'then sets the new volume to 0.
-	Otherwise, it sets the new volume to the volume before it was muted.
+	Otherwise, it sets the new volume to the volume before it was muted,
+	or to VOLUME_PERCENTAGE_INTERVAL if it was muted outside SpotKeys.
 	"""
 
 	currentVolume = currentPlaybackContext['device']['volume_percent']
 
 	if currentVolume > 0:
-		APP_STATE['preMuteVolume'] = currentVolume
+		APP_STATE.set(preMuteVolume=currentVolume)
 		spotifyHandler.volume(0)
-		speech.say('Muted', interrupt=True)
+		announce('Muted', interrupt=True)
+	elif (preMuteVolume := APP_STATE.pop('preMuteVolume')) is not None:
+		spotifyHandler.volume(preMuteVolume)
+		announce('Unmuted', interrupt=True)
 	else:
-		spotifyHandler.volume(APP_STATE['preMuteVolume'])
-		del APP_STATE['preMuteVolume']
-		speech.say('Unmuted', interrupt=True)
+		# Muted outside SpotKeys, so there is no volume to restore
+		spotifyHandler.volume(VOLUME_PERCENTAGE_INTERVAL)
+		announce(f'Unmuted, {VOLUME_PERCENTAGE_INTERVAL}% volume', interrupt=True)
 
 
-@checkForPlayingMedia
-def getCurrentTrackName(currentPlaybackContext) -> None:
-	"""Gets the name of the currently-playing track."""
+@dispatch.lane(dispatch.INFO_LANE)
+@checkForPlayingMediaWithin()
+def getCurrentTrackName(currentPlaybackContext, isStale=False) -> str:
+	"""Gets the name of the currently-playing track, announcing and returning it."""
 
-	speech.say(getTrackName(currentPlaybackContext), interrupt=True)
+	announcement = markIfStale(getTrackName(currentPlaybackContext), isStale)
+	announce(announcement, interrupt=True)
+	return announcement
 
 
-@checkForPlayingMedia
-def getCurrentTrackArtistNames(currentPlaybackContext) -> None:
-	"""Get the list of artist name(s) of the currently-playing track."""
+@dispatch.lane(dispatch.INFO_LANE)
+@checkForPlayingMediaWithin()
+def getCurrentTrackArtistNames(currentPlaybackContext, isStale=False) -> str:
+	"""Get the list of artist name(s) of the currently-playing track, announcing and returning it."""
 
-	speech.say(', '.join(getTrackArtistNames(currentPlaybackContext)), interrupt=True)
+	announcement = markIfStale(', '.join(getTrackArtistNames(currentPlaybackContext)), isStale)
+	announce(announcement, interrupt=True)
+	return announcement
 
 
-@checkForPlayingMedia
-def getCurrentTrackAlbumName(currentPlaybackContext) -> None:
-	"""Gets the album name of the currently-playing track."""
+@dispatch.lane(dispatch.INFO_LANE)
+@checkForPlayingMediaWithin()
+def getCurrentTrackAlbumName(currentPlaybackContext, isStale=False) -> str:
+	"""Gets the album name of the currently-playing track, announcing and returning it."""
 
-	speech.say(getTrackAlbumName(currentPlaybackContext), interrupt=True)
+	announcement = markIfStale(getTrackAlbumName(currentPlaybackContext), isStale)
+	announce(announcement, interrupt=True)
+	return announcement
 
 
-@checkForPlayingMedia
-def getCurrentTrackDetails(currentPlaybackContext) -> None:
+@dispatch.lane(dispatch.INFO_LANE)
+@checkForPlayingMediaWithin()
+def getCurrentTrackDetails(currentPlaybackContext, isStale=False) -> str:
 	"""
-	Gets the current track details as a single announcement, including:
+	Gets the current track details as a single announcement, which is also returned, including:
 	* Track name;
 	* Artist names; and
 	* Album name.
@@ -318,23 +516,113 @@ def getCurrentTrackDetails(currentPlaybackContext) -> None:
 	artistNames = ', '.join(getTrackArtistNames(currentPlaybackContext))
 	albumName = getTrackAlbumName(currentPlaybackContext)
 
-	speech.say(f'{trackName} by {artistNames} from {albumName}', interrupt=True)
+	announcement = markIfStale(f'{trackName} by {artistNames} from {albumName}', isStale)
+	announce(announcement, interrupt=True)
+	return announcement
+
+
+@dispatch.lane(dispatch.INFO_LANE)
+def getCurrentStatus() -> dict:
+	"""
+	Gets the full playback status as a single announcement, including:
+	* Track name, artist names and album name;
+	* Elapsed and total time;
+	* Whether the track is in Liked Songs;
+	* Shuffle and repeat state; and
+	* The device playing.
+	Playback and liked status are fetched concurrently.
+	Liked status is requested for the last known track right away, and again if the track changed.
+	Anything that has not arrived by STATUS_DEADLINE_SECONDS is left out.
+	The status is also returned as a dict of the parts that arrived, plus the announcement itself.
+	If playback can't be fetched, that is announced and the error re-raised.
+	"""
+
+	deadline = time.monotonic() + STATUS_DEADLINE_SECONDS
+
+	def remaining() -> float:
+		return max(0, deadline - time.monotonic())
+
+	likedFutures = {}
+	lastPlaybackContext = APP_STATE.get('lastPlaybackContext')
+	if lastPlaybackContext and lastPlaybackContext.get('item'):
+		lastTrackID = getTrackID(lastPlaybackContext)
+		likedFutures[lastTrackID] = dispatch.fanOut(isTrackLiked, lastTrackID)
+
+	playbackFuture = dispatch.fanOut(getCurrentPlaybackContext)
+
+	try:
+		currentPlaybackContext = playbackFuture.result(timeout=remaining())
+	except NoMediaPlayingError:
+		announce('No media playing', interrupt=True)
+		raise
+	except TimeoutError:
+		announce('Status is taking too long, try again.', interrupt=True)
+		raise
+	except Exception:
+		announce('Could not get status.', interrupt=True)
+		raise
+
+	parts = []
+	status = {}
+
+	if currentPlaybackContext.get('item'):
+		trackName = getTrackName(currentPlaybackContext)
+		artistNames = ', '.join(getTrackArtistNames(currentPlaybackContext))
+		albumName = getTrackAlbumName(currentPlaybackContext)
+		parts.append(f'{trackName} by {artistNames} from {albumName}')
+		status.update(track=trackName, artists=getTrackArtistNames(currentPlaybackContext), album=albumName)
+
+		progress = currentPlaybackContext.get('progress_ms')
+		duration = currentPlaybackContext['item'].get('duration_ms')
+		if progress is not None and duration is not None:
+			parts.append(f'{formatDuration(progress)} of {formatDuration(duration)}')
+			status.update(progressMs=progress, durationMs=duration)
+
+		trackID = getTrackID(currentPlaybackContext)
+		if trackID not in likedFutures:
+			likedFutures[trackID] = dispatch.fanOut(isTrackLiked, trackID)
+
+		try:
+			status['liked'] = likedFutures[trackID].result(timeout=remaining())
+			parts.append('Liked' if status['liked'] else 'Not liked')
+		except Exception:
+			pass
+
+	status['shuffle'] = bool(currentPlaybackContext.get('shuffle_state'))
+	parts.append('Shuffle on' if status['shuffle'] else 'Shuffle off')
+
+	repeatState = currentPlaybackContext.get('repeat_state', 'off')
+	status['repeat'] = repeatState
+	parts.append(f'Repeat {"all" if repeatState == "context" else repeatState}')
+
+	if device := currentPlaybackContext.get('device'):
+		status.update(device=device['name'], isPlaying=currentPlaybackContext['is_playing'])
+		parts.append(f'{"Playing" if status["isPlaying"] else "Paused"} on {device["name"]}')
 
+	status['announcement'] = ', '.join(parts)
+	announce(status['announcement'], interrupt=True)
+	return status
 
+
+@dispatch.lane(dispatch.INFO_LANE)
 @checkForPlayingMedia
-def copyCurrentTrackURL(currentPlaybackContext) -> None:
+def copyCurrentTrackURL(currentPlaybackContext) -> str:
 	"""
-	Copies the Spotify URL of the currently-playing track to the clipboard.
+	Copies the Spotify URL of the currently-playing track to the clipboard, and returns it.
 	"""
 
 	trackName = getTrackName(currentPlaybackContext)
 	trackID = getTrackID(currentPlaybackContext)
+	url = f'{TRACK_URL}/{trackID}'
 
-	speech.say(f'URL copied to clipboard: {trackName}', interrupt=True)
+	announce(f'URL copied to clipboard: {trackName}', interrupt=True)
 
-	pyperclip.copy(f'{TRACK_URL}/{trackID}')
+	pyperclip.copy(url)
+	return url
 
 
+@dispatch.lane(dispatch.TRANSPORT_LANE)
+@confirmWithin('Could not change repeat')
 @checkForPlayingMedia
 def cycleRepeat(currentPlaybackContext) -> None:
 	"""
@@ -351,12 +639,14 @@ def cycleRepeat(currentPlaybackContext) -> None:
 		if 'context' in nextState:
 			nextState = 'all'
 
-		speech.say(f'Repeat {nextState}')
+		announce(f'Repeat {nextState}')
 	except Exception:
-		speech.say('Repeat is not available in this context.')
-		speech.say('You must be listening to a collection like an album, a playlist, etc.')
+		announce('Repeat is not available in this context.')
+		announce('You must be listening to a collection like an album, a playlist, etc.')
 
 
+@dispatch.lane(dispatch.TRANSPORT_LANE)
+@confirmWithin('Could not change shuffle')
 @checkForPlayingMedia
 def toggleShuffle(currentPlaybackContext) -> None:
 	"""Toggles shuffle between on and off."""
@@ -367,15 +657,46 @@ def toggleShuffle(currentPlaybackContext) -> None:
 	try:
 		spotifyHandler.shuffle(newShuffleState)
 	except Exception:
-		speech.say('Shuffle is unavailable.')
+		announce('Shuffle is unavailable.')
 		return
 
 	if newShuffleState:
-		speech.say('Shuffle on')
+		announce('Shuffle on')
 	else:
-		speech.say('Shuffle off')
+		announce('Shuffle off')
+
+
+@dispatch.lane(dispatch.DIALOG_LANE)
+def searchLikedSongs() -> None:
+	"""Prompts for part of a Liked Song's title or artist, then plays the best match."""
+
+	if query := dialogs.askForText('Search Liked Songs', 'Type part of a song title or artist:'):
+		dispatch.submit(playLikedSong, query)
+
+
+@dispatch.lane(dispatch.LIBRARY_LANE)
+@confirmWithin('Could not play the song')
+def playLikedSong(query: str) -> dict | None:
+	"""
+	Plays the best match for the query from the local index of Liked Songs, and returns it.
+	No search API request is made; the match goes straight to playback.
+	Returns None if nothing matched.
+	"""
+
+	if not (matches := library.search(query, limit=1)):
+		if library.count() == 0:
+			announce('Your Liked Songs are still being indexed, try again soon.', interrupt=True)
+		else:
+			announce(f'No Liked Songs match {query}', interrupt=True)
+		return
+
+	track = matches[0]
+	spotifyHandler.start_playback(uris=[track['uri']])
+	announce(f'Playing {track["name"]} by {track["artists"]}', interrupt=True)
+	return track
 
 
+@dispatch.lane(dispatch.UPDATE_LANE)
 def checkForUpdate() -> None:
 	"""Checks if there's an available app update."""
 
@@ -2,18 +2,30 @@
 
 import time
 
-from spotKeys import controls, keyboard, speech, updater
+from spotKeys import controls, dispatch, idle, ipc, keyboard, library, speech, spotify, updater
 
 
 def initialize() -> None:
-	"""Initializes the core logic by initializing speech and registering keyboard shortcuts."""
+	"""Initializes the core logic by initializing speech, registering keyboard shortcuts and watching for idle time."""
 
 	keyboard.registerKeyboardShortcuts()
 	speech.initialize()
 	speech.say('SpotKeys is loading, please wait...')
 	time.sleep(2)
 
-	updater.checkForUpdate()
+	updater.checkForUpdate(automatic=True)
+
+	library.start()
+
+	idle.registerIdleCallback(library.stop)
+	idle.registerIdleCallback(spotify.closeConnections)
+	idle.registerIdleCallback(controls.dropCaches)
+	idle.registerIdleCallback(dispatch.releaseWorkers)
+	idle.registerWakeCallback(controls.rewarm)
+	idle.registerWakeCallback(library.start)
+	idle.start()
+
+	ipc.start()
 
 	speech.say('SpotKeys is ready.')
 	speech.say('Press alt+shift+f1 to open the help page.')
@@ -33,5 +45,9 @@ def exit() -> None:
 	while speech.isSpeaking():
 		pass
 
+	ipc.destroy()
+	idle.destroy()
+	library.stop()
+	dispatch.destroy()
 	speech.destroy()
 	keyboard.destroy()
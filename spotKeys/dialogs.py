@@ -0,0 +1,31 @@
+"""Shows simple, accessible dialogs for controls that need typed input."""
+
+import threading
+import tkinter
+from tkinter import simpledialog
+
+# Only one dialog (and so one Tk interpreter) may be open at a time
+_dialogLock = threading.Lock()
+
+
+def askForText(title: str, prompt: str) -> str | None:
+	"""
+	Shows a text input dialog in front of other windows and returns what was typed, or None if cancelled.
+	If a dialog is already open, returns None right away instead of opening a second one.
+	A hidden root window is created and destroyed per call on the calling thread.
+	"""
+
+	if not _dialogLock.acquire(blocking=False):
+		return None
+
+	try:
+		root = tkinter.Tk()
+		root.withdraw()
+		root.attributes('-topmost', True)
+
+		try:
+			return simpledialog.askstring(title, prompt, parent=root)
+		finally:
+			root.destroy()
+	finally:
+		_dialogLock.release()
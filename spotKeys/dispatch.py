@@ -0,0 +1,131 @@
+"""Runs controls off the hotkey thread in lanes that serialize related Spotify calls."""
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from spotKeys import idle
+
+# Lane names
+VOLUME_LANE = 'volume'
+TRANSPORT_LANE = 'transport'
+SEEK_LANE = 'seek'
+LIBRARY_LANE = 'library'
+UPDATE_LANE = 'update'
+DIALOG_LANE = 'dialog'
+INFO_LANE = 'info'
+
+# Every lane runs one control at a time except:
+# * info, whose controls only read and can overlap; and
+# * dialog, whose second worker lets repeat presses reach the dialog lock and be dropped instead of queueing
+LANE_WORKERS = {
+	VOLUME_LANE: 1,
+	TRANSPORT_LANE: 1,
+	SEEK_LANE: 1,
+	LIBRARY_LANE: 1,
+	UPDATE_LANE: 1,
+	DIALOG_LANE: 2,
+	INFO_LANE: 4,
+}
+
+# Pool for the concurrent Spotify requests a single control fans out to
+FAN_OUT_POOL = 'fanOut'
+FAN_OUT_WORKERS = 4
+
+POOL_WORKERS = {**LANE_WORKERS, FAN_OUT_POOL: FAN_OUT_WORKERS}
+
+# Attribute set on a control to name its lane
+LANE_ATTRIBUTE = 'lane'
+
+_executors: dict[str, ThreadPoolExecutor] = {}
+# Number of submitted but unfinished tasks per lane or pool
+_inFlight: dict[str, int] = {}
+_executorsLock = threading.Lock()
+
+
+def lane(name: str):
+	"""Decorator to mark a control as running in the given lane."""
+
+	if name not in LANE_WORKERS:
+		raise ValueError(f'Unknown lane: {name}')
+
+	def decorator(function):
+		setattr(function, LANE_ATTRIBUTE, name)
+		return function
+
+	return decorator
+
+
+def getLane(function: Callable) -> str | None:
+	"""Return the lane the given control runs in, or None if it runs inline."""
+
+	return getattr(function, LANE_ATTRIBUTE, None)
+
+
+def _submitTo(name: str, function: Callable, *args, **kwargs) -> Future:
+	"""Submit work to the given lane or pool, creating its executor on first use and counting it as in flight."""
+
+	with _executorsLock:
+		if name not in _executors:
+			_executors[name] = ThreadPoolExecutor(max_workers=POOL_WORKERS[name], thread_name_prefix=name)
+		_inFlight[name] = _inFlight.get(name, 0) + 1
+		future = _executors[name].submit(function, *args, **kwargs)
+
+	future.add_done_callback(lambda _: _finished(name))
+	return future
+
+
+def _finished(name: str) -> None:
+	"""Count one task of the given lane or pool as finished."""
+
+	with _executorsLock:
+		_inFlight[name] -= 1
+
+
+def submit(function: Callable, *args, **kwargs) -> Future:
+	"""
+	Runs the given control in its lane and returns a future for its result.
+	Controls without a lane run inline on the calling thread, so Win32 calls tied to
+	the message loop thread (like posting the quit message) still work.
+	Submitting a control counts as activity and rewarms resources after idle mode.
+	"""
+
+	idle.touch()
+	name = getLane(function)
+
+	if name is None:
+		future = Future()
+		try:
+			future.set_result(function(*args, **kwargs))
+		except Exception as e:
+			future.set_exception(e)
+		return future
+
+	return _submitTo(name, function, *args, **kwargs)
+
+
+def fanOut(function: Callable, *args, **kwargs) -> Future:
+	"""Runs one request on the fan-out pool so a control can wait on several at once."""
+
+	return _submitTo(FAN_OUT_POOL, function, *args, **kwargs)
+
+
+def releaseWorkers() -> None:
+	"""
+	Lets the threads of every idle lane and pool exit; they are recreated on next use.
+	Busy lanes (like a long update download, or an open dialog) keep their executor, so a later control in
+	a one-worker lane still queues behind the running one instead of getting a fresh executor beside it.
+	"""
+
+	with _executorsLock:
+		for name in [name for name in _executors if not _inFlight.get(name)]:
+			_executors.pop(name).shutdown(wait=False)
+
+
+def destroy() -> None:
+	"""Shuts down every lane and pool without waiting for queued work."""
+
+	with _executorsLock:
+		for executor in _executors.values():
+			executor.shutdown(wait=False, cancel_futures=True)
+		_executors.clear()
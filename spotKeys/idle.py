@@ -0,0 +1,228 @@
+"""Sheds connections, caches and memory after a period without controls, and rewarms them on demand."""
+
+import ctypes
+import gc
+import logging
+import threading
+import time
+from collections.abc import Callable
+from ctypes import wintypes
+
+from spotKeys import APP_DATA_DIR
+
+# Time without controls before entering idle mode, in seconds
+IDLE_TIMEOUT_SECONDS = 10 * 60
+
+# How often the watcher checks for inactivity, in seconds
+CHECK_INTERVAL_SECONDS = 30
+
+# Where idle mode reports RSS and wakeup latency
+STATS_LOG_PATH = APP_DATA_DIR / 'idle.log'
+
+logger = logging.getLogger(__name__)
+
+# --- Win32 bits -------------------------------------------------------------
+
+
+class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+	_fields_ = [
+		('cb', wintypes.DWORD),
+		('PageFaultCount', wintypes.DWORD),
+		('PeakWorkingSetSize', ctypes.c_size_t),
+		('WorkingSetSize', ctypes.c_size_t),
+		('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+		('QuotaPagedPoolUsage', ctypes.c_size_t),
+		('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+		('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+		('PagefileUsage', ctypes.c_size_t),
+		('PeakPagefileUsage', ctypes.c_size_t),
+	]
+
+
+kernel32 = ctypes.windll.kernel32
+kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+kernel32.K32GetProcessMemoryInfo.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESS_MEMORY_COUNTERS), wintypes.DWORD]
+kernel32.SetProcessWorkingSetSize.argtypes = [wintypes.HANDLE, ctypes.c_size_t, ctypes.c_size_t]
+
+# --- Module state -----------------------------------------------------------
+
+_idleCallbacks: list[Callable[[], None]] = []
+_wakeCallbacks: list[Callable[[], None]] = []
+
+# Guards the activity fields below; held only briefly
+_lock = threading.Lock()
+# Held for a whole idle entry or wake, so a wake waits for shedding to finish before rewarming
+_transitionLock = threading.Lock()
+_stopEvent = threading.Event()
+_watcher: threading.Thread | None = None
+_timeoutSeconds = IDLE_TIMEOUT_SECONDS
+_lastActivity = time.monotonic()
+_isIdle = False
+
+_stats = {
+	'idleCount': 0,
+	'rssBeforeIdle': None,
+	'rssAfterIdle': None,
+	'lastWakeLatency': None,
+}
+
+# --- Helpers ----------------------------------------------------------------
+
+
+def _getRSS() -> int | None:
+	"""Return the process working set size (RSS) in bytes, or None if it can't be read."""
+
+	counters = PROCESS_MEMORY_COUNTERS()
+	counters.cb = ctypes.sizeof(counters)
+	if kernel32.K32GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+		return counters.WorkingSetSize
+	return None
+
+
+def _trimWorkingSet() -> None:
+	"""Ask Windows to page out as much of the process working set as it can."""
+
+	kernel32.SetProcessWorkingSetSize(kernel32.GetCurrentProcess(), ctypes.c_size_t(-1), ctypes.c_size_t(-1))
+
+
+def _runCallbacks(callbacks: list[Callable[[], None]]) -> None:
+	"""Run each callback, so one failing doesn't stop the rest."""
+
+	for callback in callbacks:
+		try:
+			callback()
+		except Exception:
+			logger.exception('Idle callback %s failed', callback.__name__)
+
+
+def _configureStatsLog() -> None:
+	"""Send this module's log records to STATS_LOG_PATH, since the app configures no other logging."""
+
+	if logger.handlers:
+		return
+
+	try:
+		STATS_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+		handler = logging.FileHandler(STATS_LOG_PATH, encoding='utf-8')
+	except OSError:
+		return
+
+	handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+	logger.addHandler(handler)
+	logger.setLevel(logging.INFO)
+	logger.propagate = False
+
+
+def _enterIdle() -> None:
+	"""
+	Enter idle mode if there still has been no activity for the idle timeout.
+	Runs the idle callbacks, then releases memory and records how much RSS was shed.
+	"""
+
+	global _isIdle
+
+	with _transitionLock:
+		with _lock:
+			if _isIdle or time.monotonic() - _lastActivity < _timeoutSeconds:
+				return
+			_isIdle = True
+
+		rssBefore = _getRSS()
+		_runCallbacks(_idleCallbacks)
+		gc.collect()
+		_trimWorkingSet()
+		rssAfter = _getRSS()
+
+		_stats.update(idleCount=_stats['idleCount'] + 1, rssBeforeIdle=rssBefore, rssAfterIdle=rssAfter)
+		logger.info('Entered idle mode: RSS %s -> %s bytes', rssBefore, rssAfter)
+
+
+def _wake() -> None:
+	"""Run the wake callbacks once any idle entry in progress has finished, and record how long rewarming took."""
+
+	with _transitionLock:
+		start = time.perf_counter()
+		_runCallbacks(_wakeCallbacks)
+		latency = time.perf_counter() - start
+
+		_stats['lastWakeLatency'] = latency
+		logger.info('Left idle mode: rewarmed in %.3f seconds, RSS %s bytes', latency, _getRSS())
+
+
+def _watch() -> None:
+	"""Enter idle mode once no activity has been seen for the idle timeout."""
+
+	while not _stopEvent.wait(CHECK_INTERVAL_SECONDS):
+		_enterIdle()
+
+
+# --- Public API -------------------------------------------------------------
+
+
+def registerIdleCallback(callback: Callable[[], None]) -> None:
+	"""Register a callback that releases a resource (connections, caches, polling) when going idle."""
+
+	_idleCallbacks.append(callback)
+
+
+def registerWakeCallback(callback: Callable[[], None]) -> None:
+	"""Register a callback that rewarms a resource when leaving idle mode."""
+
+	_wakeCallbacks.append(callback)
+
+
+def touch() -> None:
+	"""
+	Record activity, such as a control being dispatched or a hint that the user is about to use SpotKeys.
+	If idle mode was active, resources are rewarmed on a background thread so the caller isn't delayed.
+	"""
+
+	global _isIdle, _lastActivity
+
+	with _lock:
+		_lastActivity = time.monotonic()
+		wasIdle = _isIdle
+		_isIdle = False
+
+	if wasIdle:
+		threading.Thread(target=_wake, name='idleWake', daemon=True).start()
+
+
+def isIdle() -> bool:
+	"""Returns whether idle mode is active."""
+
+	with _lock:
+		return _isIdle
+
+
+def getStats() -> dict:
+	"""
+	Returns RSS and wakeup latency figures for tuning the idle timeout.
+	This doesn't count as activity; the same figures are logged to STATS_LOG_PATH on each transition.
+	"""
+
+	return {**_stats, 'isIdle': isIdle(), 'rss': _getRSS(), 'timeoutSeconds': _timeoutSeconds}
+
+
+def start(timeoutSeconds: float = IDLE_TIMEOUT_SECONDS) -> None:
+	"""Starts watching for inactivity with the given idle timeout in seconds."""
+
+	global _timeoutSeconds, _watcher
+
+	_timeoutSeconds = timeoutSeconds
+	_configureStatsLog()
+	touch()
+
+	if _watcher is None:
+		_stopEvent.clear()
+		_watcher = threading.Thread(target=_watch, name='idleWatcher', daemon=True)
+		_watcher.start()
+
+
+def destroy() -> None:
+	"""Stops watching for inactivity."""
+
+	global _watcher
+
+	_stopEvent.set()
+	_watcher = None
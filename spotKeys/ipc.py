@@ -0,0 +1,233 @@
+"""
+Serves a local control endpoint so scripts can run controls by name.
+
+The endpoint listens on localhost TCP and speaks newline-delimited JSON, one request per line:
+
+	{"token": "...", "command": "nextTrack"}
+	{"token": "...", "command": "rewind", "kwargs": {"milliseconds": 10000}}
+	{"token": "...", "batch": [{"command": "playOrPause"}, {"command": "getCurrentTrackName"}], "timeout": 5}
+
+Every request must carry the token that `start()` writes to TOKEN_PATH, which only the current user can read.
+This keeps other users and web pages (which can reach localhost ports but not the file) from running commands.
+Each request gets one JSON line back with the result, any error and the time taken in milliseconds.
+The result is whatever the control returns: info controls return what they announce (the status control returns
+a dict of its parts), and `playLikedSong` returns the track it played. Other controls that change playback return
+null. A control that announces a problem instead, like no media playing, reports `ok: false` with that error.
+A line that isn't a valid, authenticated request gets an error reply and the connection is closed.
+Commands go through the same dispatch lanes as hotkeys, so they serialize and count as activity the same way.
+Passive queries like `getIdleStats` run directly instead, so they don't count as activity.
+"""
+
+import hmac
+import json
+import secrets
+import socketserver
+import threading
+import time
+from concurrent.futures import Future
+
+from spotKeys import APP_DATA_DIR, controls, dispatch, idle, keyboard
+
+IPC_HOST = '127.0.0.1'
+IPC_PORT = 8342
+TOKEN_PATH = APP_DATA_DIR / 'ipc.token'
+
+# How long to wait for a request's commands to finish, in seconds
+DEFAULT_TIMEOUT_SECONDS = 30
+
+# Longest request line accepted, in bytes
+MAX_REQUEST_BYTES = 64 * 1024
+
+# Every named hotkey control, plus controls only available over IPC
+COMMANDS = {
+	function.__name__: function
+	for function in keyboard.DEFAULT_KEYBOARD_SHORTCUTS.values()
+	if function.__name__ != '<lambda>'
+} | {
+	'playLikedSong': controls.playLikedSong,
+}
+
+# Queries that only report on the app; they run inline and don't count as activity
+PASSIVE_COMMANDS = {
+	'getIdleStats': idle.getStats,
+}
+
+_server: socketserver.ThreadingTCPServer | None = None
+_token: str | None = None
+
+
+class InvalidRequestError(ValueError):
+	"""Exception raised when a request line is malformed or not authenticated."""
+
+
+def _authenticate(request) -> None:
+	"""Raise InvalidRequestError unless the request is a JSON object carrying the current token."""
+
+	if not isinstance(request, dict):
+		raise InvalidRequestError('Request must be a JSON object')
+
+	token = request.get('token')
+	if not isinstance(token, str) or not hmac.compare_digest(token.encode('utf-8'), _token.encode('utf-8')):
+		raise InvalidRequestError('Missing or wrong token')
+
+
+def _startCommand(request) -> dict:
+	"""Start one command and return a record tracking its future and timing; errors are recorded, not raised."""
+
+	record = {'command': None, 'start': time.perf_counter(), 'end': None, 'future': None}
+
+	def fail(error: str) -> dict:
+		record.update(error=error, end=time.perf_counter())
+		return record
+
+	if not isinstance(request, dict):
+		return fail('Invalid request: command entries must be JSON objects')
+
+	record['command'] = name = request.get('command')
+	if not isinstance(name, str):
+		return fail('Invalid request: command must be a string')
+
+	args = request.get('args', [])
+	kwargs = request.get('kwargs', {})
+	if not isinstance(args, list) or not isinstance(kwargs, dict):
+		return fail('Invalid request: args must be a list and kwargs an object')
+
+	if name in PASSIVE_COMMANDS:
+		future = Future()
+		try:
+			future.set_result(PASSIVE_COMMANDS[name](*args, **kwargs))
+		except Exception as e:
+			future.set_exception(e)
+	elif name in COMMANDS:
+		try:
+			future = dispatch.submit(COMMANDS[name], *args, **kwargs)
+		except Exception as e:
+			return fail(str(e))
+	else:
+		return fail(f'Unknown command: {name}')
+
+	future.add_done_callback(lambda _: record.update(end=time.perf_counter()))
+	record['future'] = future
+	return record
+
+
+def _finishCommand(record: dict, deadline: float) -> dict:
+	"""Wait for a submitted command until the deadline and return its structured result."""
+
+	result = {
+		'command': record['command'],
+		'ok': False,
+		'result': None,
+		'error': record.get('error'),
+		'elapsedMs': None,
+	}
+
+	if (future := record['future']) is not None:
+		try:
+			result['result'] = future.result(timeout=max(0, deadline - time.perf_counter()))
+			result['ok'] = True
+		except TimeoutError:
+			result['error'] = 'Timed out'
+		except Exception as e:
+			result['error'] = str(e) or type(e).__name__
+
+	end = record['end'] or time.perf_counter()
+	result['elapsedMs'] = round((end - record['start']) * 1000, 3)
+	return result
+
+
+def handleRequest(request: dict) -> dict:
+	"""
+	Run a single command or a batch and return the structured result.
+	Batched commands are all submitted before any is awaited, so commands in different lanes overlap.
+	Raises InvalidRequestError if the timeout or batch isn't the right type; bad batch entries get their own error.
+	"""
+
+	timeout = request.get('timeout', DEFAULT_TIMEOUT_SECONDS)
+	if isinstance(timeout, bool) or not isinstance(timeout, int | float) or timeout < 0:
+		raise InvalidRequestError('timeout must be a non-negative number')
+
+	start = time.perf_counter()
+	deadline = start + timeout
+
+	if 'batch' in request:
+		if not isinstance(request['batch'], list):
+			raise InvalidRequestError('batch must be a list')
+
+		records = [_startCommand(command) for command in request['batch']]
+		results = [_finishCommand(record, deadline) for record in records]
+		return {
+			'ok': all(result['ok'] for result in results),
+			'results': results,
+			'elapsedMs': round((time.perf_counter() - start) * 1000, 3),
+		}
+
+	return _finishCommand(_startCommand(request), deadline)
+
+
+class CommandHandler(socketserver.StreamRequestHandler):
+	"""Reads JSON requests line by line from one connection and writes a JSON response for each."""
+
+	def handle(self):
+		while line := self.rfile.readline(MAX_REQUEST_BYTES + 1):
+			if not line.strip():
+				continue
+
+			try:
+				if len(line) > MAX_REQUEST_BYTES:
+					raise InvalidRequestError('Request is too long')
+				request = json.loads(line)
+				_authenticate(request)
+				response = handleRequest(request)
+			except ValueError as e:
+				# Also covers JSON decoding errors; anything unexpected on the line ends the connection
+				self._reply({'ok': False, 'error': f'Invalid request: {e}'})
+				return
+			except Exception as e:
+				# A bug handling one request shouldn't leave the client without a reply
+				self._reply({'ok': False, 'error': f'Internal error: {type(e).__name__}: {e}'})
+				continue
+
+			self._reply(response)
+
+	def _reply(self, response: dict) -> None:
+		self.wfile.write(json.dumps(response, default=str).encode('utf-8') + b'\n')
+
+
+class CommandServer(socketserver.ThreadingTCPServer):
+	"""Threaded TCP server for the control endpoint."""
+
+	daemon_threads = True
+
+
+def start(host: str = IPC_HOST, port: int = IPC_PORT) -> bool:
+	"""
+	Writes a fresh token to TOKEN_PATH and starts serving the control endpoint in the background.
+	Returns True on success; the endpoint is not served if the token can't be written.
+	"""
+
+	global _server, _token
+
+	try:
+		_token = secrets.token_urlsafe(32)
+		TOKEN_PATH.parent.mkdir(parents=True, exist_ok=True)
+		TOKEN_PATH.write_text(_token, encoding='utf-8')
+		_server = CommandServer((host, port), CommandHandler)
+	except OSError:
+		return False
+
+	threading.Thread(target=_server.serve_forever, name='ipcServer', daemon=True).start()
+	return True
+
+
+def destroy() -> None:
+	"""Stops serving the control endpoint."""
+
+	global _server
+
+	if _server is not None:
+		_server.shutdown()
+		_server.server_close()
+		_server = None
+
+	TOKEN_PATH.unlink(missing_ok=True)
@@ -4,7 +4,7 @@ import ctypes
 from collections.abc import Callable
 from ctypes import wintypes
 
-from spotKeys import controls, help
+from spotKeys import controls, dispatch, help
 
 # --- Config (put first) -----------------------------------------------------
 
@@ -25,9 +25,11 @@ DEFAULT_KEYBOARD_SHORTCUTS: dict[str, Callable[[], None]] = {
 	'r': controls.getCurrentTrackArtistNames,
 	'a': controls.getCurrentTrackAlbumName,
 	'i': controls.getCurrentTrackDetails,
+	't': controls.getCurrentStatus,
 	'l': controls.likeCurrentTrack,
 	'd': controls.dislikeCurrentTrack,
 	'u': controls.copyCurrentTrackURL,
+	'f': controls.searchLikedSongs,
 	'c': controls.checkForUpdate,
 	'f1': help.openHelpPage,
 	'q': lambda: ctypes.windll.user32.PostQuitMessage(0),  # quit as a normal control
@@ -117,7 +119,7 @@ def registerKeyboardShortcuts() -> None:
 
 
 def waitForInput() -> None:
-	"""Block on the Windows message loop until the quit control posts WM_QUIT."""
+	"""Block on the Windows message loop until the quit control posts WM_QUIT, dispatching hotkeys to their lanes."""
 
 	msg = MSG()
 	while GetMessageW(ctypes.byref(msg), None, 0, 0) != 0:
@@ -125,10 +127,7 @@ def waitForInput() -> None:
 			hotId = int(msg.wParam)
 			fn = _idToHandler.get(hotId)
 			if fn:
-				try:
-					fn()
-				except Exception:
-					pass
+				dispatch.submit(fn)
 	destroy()
 
 
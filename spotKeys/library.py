@@ -0,0 +1,272 @@
+"""Keeps a local, searchable index of the user's Liked Songs in SQLite."""
+
+import re
+import sqlite3
+import threading
+import unicodedata
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from spotKeys import APP_DATA_DIR
+from spotKeys.spotify import SPOTIFY_HANDLER as spotifyHandler
+
+LIBRARY_DB_PATH = APP_DATA_DIR / 'library.sqlite3'
+
+# Page size for `GET /me/tracks` (the API maximum)
+PAGE_SIZE = 50
+
+# How often the background sync runs, in seconds
+SYNC_INTERVAL_SECONDS = 15 * 60
+
+# How many matches a search returns by default
+SEARCH_LIMIT = 10
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tracks (
+	uri TEXT PRIMARY KEY,
+	name TEXT NOT NULL,
+	artists TEXT NOT NULL,
+	album TEXT NOT NULL,
+	addedAt TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tokens (
+	token TEXT NOT NULL,
+	uri TEXT NOT NULL,
+	PRIMARY KEY (token, uri)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+	key TEXT PRIMARY KEY,
+	value TEXT
+);
+"""
+
+# --- Module state -----------------------------------------------------------
+
+_connection: sqlite3.Connection | None = None
+_connectionLock = threading.RLock()
+_syncLock = threading.Lock()
+# Stop event of the current sync thread; each thread gets its own, so a stopped thread can't be revived by `start()`
+_stopEvent: threading.Event | None = None
+
+
+class SyncStoppedError(Exception):
+	"""Exception raised inside a sync when its thread has been stopped."""
+
+
+# --- Helpers ----------------------------------------------------------------
+
+
+def tokenize(text: str) -> list[str]:
+	"""Split text into lowercase, accent-free word tokens, e.g. 'Beyoncé - Halo' -> ['beyonce', 'halo']."""
+
+	normalized = unicodedata.normalize('NFKD', text.casefold())
+	stripped = ''.join(character for character in normalized if not unicodedata.combining(character))
+	return re.findall(r'\w+', stripped)
+
+
+def _getConnection() -> sqlite3.Connection:
+	"""Return the shared database connection, opening it and creating the schema on first use."""
+
+	global _connection
+
+	with _connectionLock:
+		if _connection is None:
+			LIBRARY_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+			_connection = sqlite3.connect(LIBRARY_DB_PATH, check_same_thread=False)
+			_connection.executescript(SCHEMA)
+		return _connection
+
+
+@contextmanager
+def _openForSync(stopEvent: threading.Event) -> Iterator[sqlite3.Connection]:
+	"""
+	Hold the connection lock and yield the connection, unless the sync was stopped.
+	`stop()` sets the event under the same lock, so a stopped sync never touches (or reopens) the database.
+	"""
+
+	with _connectionLock:
+		if stopEvent.is_set():
+			raise SyncStoppedError()
+		yield _getConnection()
+
+
+def _storeTracks(connection: sqlite3.Connection, items: list[dict]) -> None:
+	"""Insert or update saved-track items from `GET /me/tracks`, along with their search tokens."""
+
+	rows = []
+	for item in items:
+		track = item.get('track')
+		if not track or track.get('is_local'):
+			continue
+
+		artists = ', '.join(artist['name'] for artist in track['artists'])
+		rows.append((track['uri'], track['name'], artists, track['album']['name'], item['added_at']))
+
+	with connection:
+		connection.executemany('INSERT OR REPLACE INTO tracks VALUES (?, ?, ?, ?, ?)', rows)
+		for uri, name, artists, _, _ in rows:
+			connection.execute('DELETE FROM tokens WHERE uri = ?', (uri,))
+			tokens = set(tokenize(name)) | set(tokenize(artists))
+			connection.executemany('INSERT INTO tokens VALUES (?, ?)', ((token, uri) for token in tokens))
+
+
+def _getNewestAddedAt(connection: sqlite3.Connection) -> str | None:
+	"""Return the `added_at` timestamp of the most recently saved indexed track."""
+
+	return connection.execute('SELECT MAX(addedAt) FROM tracks').fetchone()[0]
+
+
+def _getMeta(connection: sqlite3.Connection, key: str) -> str | None:
+	"""Return a value from the meta table, or None if unset."""
+
+	row = connection.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+	return row[0] if row else None
+
+
+def _setMeta(connection: sqlite3.Connection, key: str, value: str | None) -> None:
+	"""Set a value in the meta table."""
+
+	with connection:
+		connection.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (key, value))
+
+
+def _removeTracksExcept(connection: sqlite3.Connection, uris: set[str]) -> None:
+	"""Remove indexed tracks that are no longer in the user's Liked Songs."""
+
+	with connection:
+		connection.execute('CREATE TEMP TABLE IF NOT EXISTS seen (uri TEXT PRIMARY KEY)')
+		connection.execute('DELETE FROM seen')
+		connection.executemany('INSERT OR IGNORE INTO seen VALUES (?)', ((uri,) for uri in uris))
+		connection.execute('DELETE FROM tracks WHERE uri NOT IN (SELECT uri FROM seen)')
+		connection.execute('DELETE FROM tokens WHERE uri NOT IN (SELECT uri FROM seen)')
+
+
+def _syncLoop(stopEvent: threading.Event) -> None:
+	"""Sync right away, then every SYNC_INTERVAL_SECONDS until the given event is set."""
+
+	while True:
+		try:
+			sync(stopEvent=stopEvent)
+		except Exception:
+			pass
+		if stopEvent.wait(SYNC_INTERVAL_SECONDS):
+			return
+
+
+# --- Public API -------------------------------------------------------------
+
+
+def count() -> int:
+	"""Returns the number of indexed tracks."""
+
+	with _connectionLock:
+		return _getConnection().execute('SELECT COUNT(*) FROM tracks').fetchone()[0]
+
+
+def sync(full: bool = False, stopEvent: threading.Event | None = None) -> None:
+	"""
+	Brings the index up to date with the user's Liked Songs.
+	Saved tracks are paged newest first, so an incremental sync stops at the first page reaching already-indexed
+	tracks. A full sync pages everything and removes tracks no longer saved. It runs instead when the last sync
+	didn't finish, and after an incremental sync that leaves more tracks indexed than are saved (e.g. after unliking).
+	If `stopEvent` is set, the sync stops without writing anything further.
+	"""
+
+	stopEvent = stopEvent or threading.Event()
+
+	try:
+		with _syncLock:
+			with _openForSync(stopEvent) as connection:
+				full = full or _getMeta(connection, 'complete') != '1'
+				newestAddedAt = None if full else _getNewestAddedAt(connection)
+				_setMeta(connection, 'complete', '0')
+
+			seenURIs = set()
+			offset = 0
+
+			while True:
+				page = spotifyHandler.current_user_saved_tracks(limit=PAGE_SIZE, offset=offset)
+				items = page['items']
+				freshItems = [item for item in items if not newestAddedAt or item['added_at'] >= newestAddedAt]
+
+				with _openForSync(stopEvent) as connection:
+					_storeTracks(connection, freshItems)
+				seenURIs.update(item['track']['uri'] for item in items if item.get('track'))
+
+				if len(freshItems) < len(items) or not page['next']:
+					break
+				offset += PAGE_SIZE
+
+			with _openForSync(stopEvent) as connection:
+				if full:
+					_removeTracksExcept(connection, seenURIs)
+				_setMeta(connection, 'complete', '1')
+				needsFullSync = not full and count() > page['total']
+	except SyncStoppedError:
+		return
+
+	if needsFullSync:
+		sync(full=True, stopEvent=stopEvent)
+
+
+def search(query: str, limit: int = SEARCH_LIMIT) -> list[dict]:
+	"""
+	Returns indexed tracks whose title or artist words start with every word of the query.
+	Titles starting with the query come first, then the most recently saved tracks.
+	"""
+
+	if not (tokens := tokenize(query)):
+		return []
+
+	# Each query token matches a range of index tokens, e.g. 'hal' matches 'hal' up to (but excluding) 'ham'
+	matches = ' INTERSECT '.join(['SELECT uri FROM tokens WHERE token >= ? AND token < ?'] * len(tokens))
+	parameters = [bound for token in tokens for bound in (token, token[:-1] + chr(ord(token[-1]) + 1))]
+
+	# Escape LIKE wildcards so the title-prefix ranking matches the query literally
+	titlePrefix = re.sub(r'([%_\\])', r'\\\1', query.strip().lower()) + '%'
+
+	with _connectionLock:
+		rows = (
+			_getConnection()
+			.execute(
+				f"""
+				SELECT uri, name, artists, album FROM tracks
+				WHERE uri IN ({matches})
+				ORDER BY lower(name) LIKE ? ESCAPE '\\' DESC, addedAt DESC
+				LIMIT ?
+				""",
+				[*parameters, titlePrefix, limit],
+			)
+			.fetchall()
+		)
+
+	return [dict(zip(('uri', 'name', 'artists', 'album'), row)) for row in rows]
+
+
+def start() -> None:
+	"""Starts syncing the index in the background, unless a sync thread is already running."""
+
+	global _stopEvent
+
+	with _connectionLock:
+		if _stopEvent is not None and not _stopEvent.is_set():
+			return
+		_stopEvent = threading.Event()
+		threading.Thread(target=_syncLoop, args=(_stopEvent,), name='librarySync', daemon=True).start()
+
+
+def stop() -> None:
+	"""
+	Stops background syncing and closes the database; it is reopened on next use.
+	A sync blocked on a request exits once it returns, without writing; `start()` can run meanwhile.
+	"""
+
+	global _connection
+
+	with _connectionLock:
+		if _stopEvent is not None:
+			_stopEvent.set()
+
+		if _connection is not None:
+			_connection.close()
+			_connection = None
@@ -1,7 +1,12 @@
 """Stores speech-related functionality."""
 
+import threading
+
 import tolk
 
+# Controls speak from several threads at once, so Tolk calls are made one at a time
+_tolkLock = threading.Lock()
+
 
 def initialize() -> None:
 	"""Initializes Tolk."""
@@ -12,13 +17,15 @@ def initialize() -> None:
 def say(text: str, interrupt: bool = False) -> None:
 	"""Speaks the given text with Tolk."""
 
-	tolk.speak(text, interrupt=interrupt)
+	with _tolkLock:
+		tolk.speak(text, interrupt=interrupt)
 
 
 def isSpeaking() -> bool:
 	"""Returns whether or not Tolk is speaking."""
 
-	return tolk.is_speaking()
+	with _tolkLock:
+		return tolk.is_speaking()
 
 
 def destroy() -> None:
@@ -69,6 +69,13 @@ def signOut():
 	authManager.cache_handler.delete_cached_token()
 
 
+def closeConnections():
+	"""Close pooled HTTP connections; they are reopened on the next request."""
+
+	for session in (SPOTIFY_HANDLER._session, authManager._session):
+		session.close()
+
+
 # Auto-login on import if no cached token exists
 ensureLogin()
 
@@ -0,0 +1,51 @@
+"""Stores app-level state behind a lock so concurrently-running controls see consistent values."""
+
+import threading
+from dataclasses import dataclass, fields, replace
+
+
+@dataclass
+class AppState:
+	"""Typed container for app-level state shared between controls."""
+
+	# Volume before muting; None when not muted
+	preMuteVolume: int | None = None
+
+	# Most recent playback context fetched from Spotify; None until the first fetch
+	lastPlaybackContext: dict | None = None
+
+
+class AppStateStore:
+	"""
+	Thread-safe store around an AppState instance.
+	Each call is atomic, and every write replaces the state rather than changing it in place.
+	Sequences spanning several calls are not atomic; controls doing them rely on their dispatch lane
+	(e.g. the volume lane) to keep them from overlapping.
+	"""
+
+	def __init__(self):
+		"""Initialize the store with default state."""
+
+		self._state = AppState()
+		self._lock = threading.Lock()
+
+	def get(self, name: str):
+		"""Return the current value of the given state field."""
+
+		with self._lock:
+			return getattr(self._state, name)
+
+	def set(self, **changes) -> None:
+		"""Atomically set one or more state fields."""
+
+		with self._lock:
+			self._state = replace(self._state, **changes)
+
+	def pop(self, name: str):
+		"""Atomically return the given state field and reset it to its default."""
+
+		with self._lock:
+			value = getattr(self._state, name)
+			default = next(field.default for field in fields(AppState) if field.name == name)
+			self._state = replace(self._state, **{name: default})
+			return value
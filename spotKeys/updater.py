@@ -1,26 +1,81 @@
 import json
+import re
+import time
 from pathlib import Path
 
 import pyperclip
 import requests
 
-from spotKeys import speech
+from spotKeys import APP_DATA_DIR, speech
 
 LIVE_MANIFEST_URL = 'https://raw.githubusercontent.com/leibylucw/spot-keys/main/manifest.json'
 LOCAL_MANIFEST_PATH = Path(__file__).resolve().parent.parent / 'manifest.json'
 DOCUMENTS_PATH = Path.home() / 'Documents'
+UPDATE_CHECK_STATE_PATH = APP_DATA_DIR / 'updateCheck.json'
 
+# Minimum time between automatic update checks, in seconds
+AUTOMATIC_CHECK_INTERVAL_SECONDS = 24 * 60 * 60
 
-def getLiveManifest() -> str | None:
-	"""Return the live `manifest.json` as text, or None on failure."""
+
+def loadUpdateCheckState() -> dict:
+	"""Read the cached live manifest and its validators from disk; return {} if missing or invalid."""
+
+	try:
+		return json.loads(UPDATE_CHECK_STATE_PATH.read_text(encoding='utf-8'))
+	except (OSError, json.JSONDecodeError):
+		return {}
+
+
+def saveUpdateCheckState(checkState: dict) -> None:
+	"""Write the cached live manifest and its validators to disk, ignoring failures."""
 
 	try:
-		response = requests.get(LIVE_MANIFEST_URL, timeout=10)
-		response.raise_for_status()
-		return response.text
+		UPDATE_CHECK_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+		UPDATE_CHECK_STATE_PATH.write_text(json.dumps(checkState), encoding='utf-8')
+	except OSError:
+		pass
+
+
+def getLiveManifest(maxAge: float = 0) -> str | None:
+	"""
+	Return the live `manifest.json` as text, or None on failure.
+	If the cached copy was checked less than `maxAge` seconds ago, it is returned without a request.
+	Otherwise a conditional GET is sent, and a 304 response means the cached copy is still current.
+	"""
+
+	checkState = loadUpdateCheckState()
+	cachedText = checkState.get('manifest')
+
+	if cachedText and time.time() - checkState.get('lastCheck', 0) < maxAge:
+		return cachedText
+
+	headers = {}
+	if cachedText:
+		if etag := checkState.get('etag'):
+			headers['If-None-Match'] = etag
+		if lastModified := checkState.get('lastModified'):
+			headers['If-Modified-Since'] = lastModified
+
+	try:
+		response = requests.get(LIVE_MANIFEST_URL, headers=headers, timeout=10)
+		if response.status_code != 304:
+			response.raise_for_status()
 	except requests.exceptions.RequestException:
 		return None
 
+	if response.status_code == 304:
+		checkState['lastCheck'] = time.time()
+	else:
+		checkState = {
+			'manifest': response.text,
+			'etag': response.headers.get('ETag'),
+			'lastModified': response.headers.get('Last-Modified'),
+			'lastCheck': time.time(),
+		}
+
+	saveUpdateCheckState(checkState)
+	return checkState['manifest']
+
 
 def getLocalManifest() -> str | None:
 	"""Read manifest.json from the repo root; return its text or None."""
@@ -46,10 +101,21 @@ def getVersion(manifestJSON: dict) -> str:
 	return manifestJSON.get('version', '')
 
 
-def parseVersion(version: str) -> tuple[int, int, int, tuple[int, ...]]:
-	"""Normalize a version string to a tuple for comparison."""
+def parseVersion(version: str) -> tuple[int, ...]:
+	"""
+	Normalize a version string to a tuple of integers for comparison, so '0.10.0' sorts after '0.9.0'.
+	Only the leading digits of each part count (e.g. '1rc2' -> 1), and missing parts are treated as 0.
+	"""
+
+	parts = []
+	for part in version.strip().lstrip('vV').split('.'):
+		digits = re.match(r'\d*', part).group()
+		parts.append(int(digits) if digits else 0)
 
-	return tuple(version.split('.'))
+	while len(parts) < 3:
+		parts.append(0)
+
+	return tuple(parts)
 
 
 def compareVersions(version1: tuple, version2: tuple) -> bool:
@@ -78,8 +144,11 @@ def downloadUpdate(updateLink: str, version: str) -> bool:
 		return False
 
 
-def checkForUpdate() -> None:
-	"""Compare local version to live; download update if available."""
+def checkForUpdate(automatic: bool = False) -> None:
+	"""
+	Compare local version to live; download update if available.
+	Automatic checks reuse the cached live manifest if it was checked within AUTOMATIC_CHECK_INTERVAL_SECONDS.
+	"""
 
 	localText = getLocalManifest()
 	if localText is None:
@@ -92,7 +161,7 @@ def checkForUpdate() -> None:
 		speech.say('Local version is missing or invalid.')
 		return
 
-	liveText = getLiveManifest()
+	liveText = getLiveManifest(maxAge=AUTOMATIC_CHECK_INTERVAL_SECONDS if automatic else 0)
 	if liveText is None:
 		speech.say('Could not check for updates.')
 		return